@@ -7,6 +7,6 @@ from .base import raw, get_dll_version, set_emulation, get_count
 from .structs import Version, Settings, Property, DataStatus, ErrorStatus, Gain, PowerSave, \
     ImpedanceSetup, ImpedanceMode, ImpedanceSettings, Voltages, FrequencyBandwidth, Pll
 from .device import Device
-from .sample import Sample
+from .sample import Sample, SampleChunk
 from .impedance import Impedance
-from .ring_buffer import RingBuffer
+from .ring_buffer import RingBuffer, ChannelRingBuffer
@@ -0,0 +1,125 @@
+"""Sample collection loop for nvx.device.Device.
+If numba is installed, the loop is JIT-compiled and runs without the GIL, calling the driver without returning to the
+interpreter between samples. Otherwise, a plain python loop is used.
+"""
+import ctypes
+from .base import raw
+
+try:
+    from numba import njit, typeof
+except ImportError:
+    njit = None
+
+# Typed prototype of NVXGetData, which compiled code can call directly
+_get_data = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_int32), ctypes.c_uint)(
+    ctypes.cast(raw.NVXGetData, ctypes.c_void_p).value
+)
+
+
+def accept(counter, rate, source_rate):
+    """Decide if a sample should be kept, to reduce the device's source rate to the requested rate.
+    A sample is kept if int(ratio * counter) != int(ratio * (counter + 1)), where ratio = rate / source_rate: it fills
+    a new "cup" of the output rate. The check is computed with integers only. Since it depends on the sample counter
+    alone, it stays correct when samples are dropped.
+
+    Parameters
+    ----------
+    counter : int
+        Sequencing counter of the sample.
+    rate : int
+        Requested sample rate.
+    source_rate : int
+        Rate at which the device generates samples.
+
+    Returns
+    -------
+    bool
+        True if the sample is to be kept.
+    """
+    return (rate * counter) // source_rate != (rate * counter + rate) // source_rate
+
+
+def _drain_python(get_data, handle, record, data, head, rate, source_rate):
+    """Write all available samples from the driver into `data`, keeping only the samples accepted at `rate`.
+    head[0] is advanced after every written record. Returns 0 if the driver has no more data, or an error code returned
+    by the driver.
+    """
+    record_ptr = record.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+    record_bytes = record.nbytes
+    last = record.shape[0] - 1
+    mask = data.shape[0] - 1
+    while True:
+        code = get_data(handle, record_ptr, record_bytes)
+        if code <= 0:
+            return code
+
+        if accept(int(record[last]) & 0xFFFFFFFF, rate, source_rate):
+            position = head[0]
+            data[position & mask] = record
+            head[0] = position + 1
+
+
+def _drain_jit(get_data, handle, record, data, head, rate, source_rate):
+    """Write all available samples from the driver into `data`, keeping only the samples accepted at `rate`.
+    head[0] is advanced after every written record. Returns 0 if the driver has no more data, or an error code returned
+    by the driver.
+    """
+    record_bytes = record.shape[0] * 4
+    last = record.shape[0] - 1
+    mask = data.shape[0] - 1
+    while True:
+        code = get_data(handle, record.ctypes, record_bytes)
+        if code <= 0:
+            return code
+
+        if _accept(record[last] & 0xFFFFFFFF, rate, source_rate):
+            position = head[0]
+            data[position & mask] = record
+            head[0] = position + 1
+
+
+if njit is None:
+    _drain = _drain_python
+else:
+    _accept = njit(cache=True)(accept)
+    _drain = njit(nogil=True, cache=True)(_drain_jit)
+
+
+def prepare(handle, record, data, head, rate, source_rate):
+    """Compile the collection loop for the types of the given arguments, without calling it.
+    Compilation takes a noticeable amount of time the first time it is done (later runs load it from numba's cache),
+    so it should be done before the device starts generating samples. Does nothing if numba is not installed.
+
+    Parameters are the same as in drain.
+    """
+    if njit is not None:
+        _drain.compile(tuple(typeof(arg) for arg in (_get_data, handle, record, data, head, rate, source_rate)))
+
+
+def drain(handle, record, data, head, rate, source_rate):
+    """Write all available samples from the driver into a ring of records.
+    Only samples accepted at the requested rate are kept, see accept.
+
+    Parameters
+    ----------
+    handle : int
+        Device handle returned by NVXOpen.
+    record : numpy.ndarray
+        A 1D int32 array of eeg_count + aux_count + 2 values, used as scratch space for one raw sample.
+    data : numpy.ndarray
+        A 2D int32 array of records, with a power of two rows, each as long as `record`.
+    head : numpy.ndarray
+        A 1D int64 array of one value: total amount of records written so far. Record i is stored in row
+        i % len(data). It is advanced right after every record is written, so that a reader in another thread always
+        sees how far the writes have gone. While head[0] is h, row h % len(data) may be in the middle of a write.
+    rate : int
+        Requested sample rate.
+    source_rate : int
+        Rate at which the device generates samples.
+
+    Returns
+    -------
+    int
+        0 if the driver has no more data, or an error code returned by the driver.
+    """
+    return _drain(_get_data, handle, record, data, head, rate, source_rate)
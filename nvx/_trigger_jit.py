@@ -0,0 +1,75 @@
+"""Batch trigger polling for nvx.trigger_states_view.TriggerStatesView.
+If numba is installed, the polling loop is JIT-compiled and calls the driver without returning to the interpreter
+between reads. Otherwise, a plain python loop is used.
+"""
+import ctypes
+import numpy as np
+from .base import raw
+
+try:
+    from numba import njit, typeof
+except ImportError:
+    njit = None
+
+# Typed prototype of NVXGetTriggers, which compiled code can call directly
+_get_triggers = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint))(
+    ctypes.cast(raw.NVXGetTriggers, ctypes.c_void_p).value
+)
+
+
+def _poll_python(get_triggers, handle, out):
+    """Fill `out` with consecutive trigger reads. Returns 0, or the first error code returned by the driver."""
+    value = ctypes.c_uint(0)
+    for i in range(out.shape[0]):
+        error = get_triggers(handle, ctypes.byref(value))
+        if error < 0:
+            return error
+        out[i] = value.value & 0xFFFF
+    return 0
+
+
+def _poll_jit(get_triggers, handle, out):
+    """Fill `out` with consecutive trigger reads. Returns 0, or the first error code returned by the driver."""
+    value = np.zeros(1, dtype=np.uint32)
+    for i in range(out.shape[0]):
+        error = get_triggers(handle, value.ctypes)
+        if error < 0:
+            return error
+        out[i] = value[0] & 0xFFFF
+    return 0
+
+
+_poll = _poll_python if njit is None else njit(cache=True)(_poll_jit)
+
+
+def prepare(handle):
+    """Compile the polling loop for the type of the given handle, without calling it.
+    Compilation takes a noticeable amount of time the first time it is done (later runs load it from numba's cache),
+    so it should be done before the first poll. Does nothing if numba is not installed.
+
+    Parameters
+    ----------
+    handle : int
+        Device handle returned by NVXOpen.
+    """
+    if njit is not None:
+        _poll.compile((typeof(_get_triggers), typeof(handle), typeof(np.empty(0, dtype=np.uint16))))
+
+
+def poll(handle, out):
+    """Read device's triggers once for every element of `out`.
+
+    Parameters
+    ----------
+    handle : int
+        Device handle returned by NVXOpen.
+    out : numpy.ndarray
+        A 1D uint16 array to fill with trigger bitfields: input triggers in bits [0, 8), output triggers in bits
+        [8, 16).
+
+    Returns
+    -------
+    int
+        0, or the first error code returned by the driver.
+    """
+    return _poll(_get_triggers, handle, out)
@@ -11,6 +11,15 @@ if is_64bit():
 else:
     raw = ctypes.cdll.LoadLibrary(os.path.dirname(__file__) + "/dll/x86/Release/NVX136.dll")
 
+# Prototypes of functions called on hot paths (sample collection and triggers), so that ctypes converts arguments
+# using a fixed signature instead of inspecting them on every call
+raw.NVXGetData.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint]
+raw.NVXGetData.restype = ctypes.c_int
+raw.NVXGetTriggers.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+raw.NVXGetTriggers.restype = ctypes.c_int
+raw.NVXSetTriggers.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+raw.NVXSetTriggers.restype = ctypes.c_int
+
 
 def get_dll_version():
     """Get driver dll's version.
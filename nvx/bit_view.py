@@ -3,6 +3,8 @@ import ctypes
 
 
 class BitView:
+    __slots__ = ("value", "begin", "end")
+
     def __init__(self, value=ctypes.c_uint(0), begin=0, end=None):
         """A wrapper around some ctypes object, providing direct array-like access to the bits.
         Constructor assigns `value` as a source of bits, with optional begin and end to limit bit visibility.
@@ -32,8 +34,13 @@ class BitView:
     def __len__(self):
         return self.end - self.begin
 
+    def __int__(self):
+        """Viewed bits as an integer: bit `begin` of the source value becomes bit 0."""
+        return (self.value.value >> self.begin) & ((1 << (self.end - self.begin)) - 1)
+
     def __str__(self):
-        return str(list(self))
+        value = int(self)
+        return str([bool((value >> i) & 1) for i in range(self.end - self.begin)])
 
     def __getitem__(self, index):
         """View a bit at a specified index.
@@ -73,5 +80,5 @@ class BitView:
         if index < 0 or index >= len(self):
             raise IndexError("Index (" + str(index) + ") not in range [0, " + str(len(self)) + ")")
 
-        self.value.value &= ~(      1 << self.begin + index)  # Clear target bit
-        self.value.value |=  (bool(x) << self.begin + index)  # Set target bit to x
\ No newline at end of file
+        bit = self.begin + index
+        self.value.value = (self.value.value & ~(1 << bit)) | (bool(x) << bit)  # Clear target bit, then set it to x
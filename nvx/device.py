@@ -1,18 +1,20 @@
 """NVX hardware device representation."""
 import ctypes
-from threading import Thread
-import time
+from threading import Thread, Event
 import math
+import operator
+import numpy as np
 
 from .structs import Version, Settings, Property, DataStatus, ErrorStatus, Gain, PowerSave, \
-    ImpedanceSetup, ImpedanceMode, ScanFreq, ImpedanceSettings, Voltages, FrequencyBandwidth, Pll, Rate
+    ImpedanceSetup, ImpedanceMode, ScanFreq, ImpedanceSettings, Voltages, FrequencyBandwidth, Pll, Mode, Rate, \
+    Decimation
 from .base import raw, get_count
 from .utility import handle_error
-from .sample import Sample
-from .ring_buffer import RingBuffer
+from .sample import Sample, SampleChunk
 from .impedance import Impedance
 from .trigger_states_view import TriggerStatesView
 from .channel_states_view import ChannelStatesView
+from . import _collect_jit
 
 
 class Device:
@@ -44,18 +46,30 @@ class Device:
         # Data collecting ----------------------------------------------------------------------------------------------
         self._buffer_time = buffer_time
         self._buffer = None  # Created at start()
+
+        # Total amount of records written to the buffer by the collector thread, and read from it by pull_chunk.
+        # The collector thread is the only writer of _head, and pull_chunk is the only writer of _tail, so no lock is
+        # needed. _head is an array, so that the collection loop can advance it after every record (see
+        # _collect_jit.drain).
+        self._head = np.zeros(1, dtype=np.int64)
+        self._tail = 0
         self._collector_thread = Thread(target=self._collect)
+        self._stop_event = Event()  # Set by stop() to wake the collector thread
         self._delay_tolerance = 0.01
 
         # Member variables ---------------------------------------------------------------------------------------------
         self._index = index
         self._is_running = False  # Not for external use. Use start(), stop(), or is_running property instead.
         self._active_shield_gain = 100
+        self._trigger_states = None  # Created on first access to trigger_states
 
         # Data acquisition rate (hz). Not always the same as source_rate property.
         # Not for external use. Use rate property instead.
         self._rate = 10000
 
+        # Rate at which the hardware generates samples. Read once at start(), since it does not change while running.
+        self._source_rate = None
+
         # Set source rate to the maximum. Seems that this results in the least delay. Unneeded samples are discarded
         # during collection.
         s = self._settings
@@ -119,7 +133,7 @@ class Device:
 
     @property
     def acquisition_mode(self):
-        return self._settings.mode
+        return Mode(self._settings.mode)
 
     @acquisition_mode.setter
     def acquisition_mode(self, value):
@@ -129,7 +143,7 @@ class Device:
 
     @property
     def decimation(self):
-        return self._settings.mode
+        return Decimation(self._settings.decimation)
 
     @decimation.setter
     def decimation(self, value):
@@ -245,7 +259,13 @@ class Device:
         ----------
         value : int
             device's sample output rate in range [1, 100000] (samples/s).
+
+        Raises
+        ------
+        TypeError
+            If value is not an integer. The collection loop is compiled for an integer rate.
         """
+        value = operator.index(value)
         if value <= 0:
             raise ValueError("sampling frequency too low: must not be less than 1, got " + str(value))
         elif value > 100000:
@@ -259,8 +279,14 @@ class Device:
     def _new_buffer(self):
         """Create a new internal buffer.
         Not recommended for external use.
+
+        The buffer is a 2D int32 array, used as a ring of records: record i is stored in row i % len(buffer), see _head
+        and _tail. Each row is a full sample record, as laid out by the driver: EEG, AUX, status, counter. The amount of
+        rows is rounded up to a power of two, so that record positions can wrap around using a bitmask.
         """
-        return RingBuffer(math.ceil(self.rate * self._buffer_time), dtype=object)
+        record_size = self.eeg_count + self.aux_count + 2
+        capacity = 1 << (math.ceil(self.rate * self._buffer_time) - 1).bit_length()
+        return np.empty((capacity, record_size), dtype=np.int32)
 
     def start(self):
         """Start data acquisition.
@@ -268,8 +294,17 @@ class Device:
         """
         if not self.is_running:
             self._buffer = self._new_buffer()
+            self._head[0] = 0
+            self._tail = 0
+            self._source_rate = self.source_rate
+
+            # Compile the collection loop now, so that samples do not pile up in the driver while it compiles
+            _collect_jit.prepare(
+                self.device_handle, self._buffer[0], self._buffer, self._head, self._rate, self._source_rate)
+
             handle_error(raw.NVXStart(self.device_handle))
             self._is_running = True
+            self._stop_event.clear()
             self._collector_thread.start()
 
     def stop(self):
@@ -278,6 +313,7 @@ class Device:
         """
         if self.is_running:
             self._is_running = False
+            self._stop_event.set()
             self._collector_thread.join()
             handle_error(raw.NVXStop(self.device_handle))
 
@@ -286,7 +322,8 @@ class Device:
         """Get device's delay tolerance.
         Delay tolerance represents time in seconds, how much the device is allowed to wait before attempting to pull a
         data sample. Even with this time, the collector thread will sleep only when it has collected all the samples
-        that were available.
+        that were available. The collector thread starts with short waits, and doubles them while no new samples
+        arrive, up to delay tolerance.
 
         Default time is 0.01 seconds, and can be set to 0 (although that might lead to inconsistent pull times due to
         thread locks fighting).
@@ -336,8 +373,8 @@ class Device:
         Returns a data sample or None, if there are no more samples generated.
         Not recommended for external use. Consider using Device.pull_chunk method instead.
 
-        When the device is running, this class calls this function until there are no more samples to get.
-        Otherwise, the internal buffer may overflow.
+        When the device is running, the collector thread reads samples directly into the internal buffer (see
+        nvx._collect_jit), and samples returned by this function are not seen by Device.pull_chunk.
 
         Returns
         -------
@@ -352,45 +389,96 @@ class Device:
         if ret == 0:  # no more data to return
             return None
 
-        return Sample(buffer, self.eeg_count, self.aux_count)
+        # Buffer is released on return, so the sample must hold a copy of the data
+        return Sample(buffer, self.eeg_count, self.aux_count, copy=True)
 
     def _collect(self):
         """Collect and process samples when running.
         Not recommended for external use.
         """
-        while self.is_running:
-            # Get new sample (returns None if no samples left)
-            sample = self._get_data()
+        # Scratch space for one raw sample, reused for every sample
+        record = np.empty(self.eeg_count + self.aux_count + 2, dtype=np.int32)
 
-            if sample is not None and self._process(sample):
-                self._buffer.append(sample)
-            if sample is None and self.delay_tolerance > 0:
-                time.sleep(self.delay_tolerance)
+        # None of these change while the device is running. Rate is not hoisted, since it can be set at any time.
+        drain = _collect_jit.drain
+        wait = self._stop_event.wait
+        handle = self.device_handle
+        data = self._buffer
+        source_rate = self._source_rate
+        delay_tolerance = self._delay_tolerance
+        head = self._head
+        idle = 0  # Consecutive polls that produced no new records
 
-    def _process(self, sample):
-        """Process a sample (figure out if it should be discarded to keep user-specified rate).
-        Returns True if a sample is to be accepted.
-        Not recommended for external use.
-        """
-        ratio = self.rate / self.source_rate
+        while self._is_running:
+            # Move all available samples into the buffer, keeping only accepted ones (see _collect_jit.accept). Every
+            # record is published to pull_chunk as soon as it is written.
+            previous = head[0]
+            handle_error(drain(handle, record, data, head, self._rate, source_rate))
+
+            idle = 0 if head[0] != previous else idle + 1
+
+            # Wait 0.1 ms, doubling while no records arrive, up to delay_tolerance. stop() interrupts the wait.
+            if delay_tolerance > 0:
+                wait(min(delay_tolerance, 0.0001 * (1 << min(idle, 10))))
 
-        cup0 = int(ratio * sample.counter)
-        cup1 = int(ratio * (sample.counter+1))
+    def pull_chunk_array(self):
+        """Pull all samples from the device as numpy arrays.
+        Each array is a C-contiguous copy of its columns of the pulled records.
 
-        # if a cup was filled, accept sample
-        return cup0 != cup1
+        Returns
+        -------
+        tuple of numpy.ndarray
+            (eeg, aux, counters, triggers), where eeg and aux have shape (n_samples, eeg_count) and
+            (n_samples, aux_count), and counters and triggers have shape (n_samples,). Triggers hold the raw status
+            bitfield of each sample (see nvx.sample.Sample). Arrays can be empty, if no samples were generated since
+            last call.
+        """
+        chunk = self.pull_chunk()
+        return (np.ascontiguousarray(chunk.eeg), np.ascontiguousarray(chunk.aux),
+                np.ascontiguousarray(chunk.counters), np.ascontiguousarray(chunk.status))
 
     def pull_chunk(self):
         """Pull all samples from the device.
+        Pulling does not block the collector thread. Samples can only be pulled from one thread at a time.
 
         Returns
         -------
-        nvx.ring_buffer.RingBuffer
-            Requested samples. list can be empty, if no samples were generated since last call.
+        nvx.sample.SampleChunk
+            Requested samples. Chunk can be empty, if no samples were generated since last call. Iterating the chunk
+            produces nvx.sample.Sample objects.
+
+        See Also
+        --------
+        nvx.device.Device.pull_chunk_array
+            Pull samples as numpy arrays.
         """
-        # TODO: is this actually thread-safe?
-        result, self._buffer = self._buffer, self._new_buffer()
-        return result
+        if self._buffer is None:  # Not started yet
+            return SampleChunk(
+                np.empty((0, self.eeg_count + self.aux_count + 2), dtype=np.int32), self.eeg_count, self.aux_count)
+
+        data = self._buffer
+        capacity = data.shape[0]
+
+        # Records written after this point are left for the next pull
+        head = int(self._head[0])
+        tail = max(self._tail, head - capacity)  # Records older than capacity were overwritten
+        count = head - tail
+
+        # The collector thread keeps writing into the buffer, so records must be copied out
+        result = np.empty((count, data.shape[1]), dtype=data.dtype)
+        begin = tail & (capacity - 1)
+        first = min(count, capacity - begin)
+        result[:first] = data[begin:begin + first]
+        result[first:] = data[:count - first]
+
+        # Drop records that the collector thread could have overwritten while they were being copied. While _head is
+        # h, record h is being written over record h - capacity, so that record counts as overwritten too.
+        overwritten = int(self._head[0]) + 1 - capacity - tail
+        if overwritten > 0:
+            result = result[overwritten:]
+
+        self._tail = head
+        return SampleChunk(result, self.eeg_count, self.aux_count)
 
     @property
     def _data_status(self):
@@ -435,13 +523,19 @@ class Device:
     @property
     def trigger_states(self):
         """Provides a view into device's trigger states
+        The same view is returned on every access. Its cached input triggers are discarded on every access, so
+        `device.trigger_states.input` always reads fresh input triggers.
 
         Returns
         -------
         TriggerStatesView
             Triggers' view. See trigger_states_view.py
         """
-        return TriggerStatesView(self)
+        if self._trigger_states is None:
+            self._trigger_states = TriggerStatesView(self)
+        else:
+            self._trigger_states.refresh()
+        return self._trigger_states
 
     @property
     def aux_gain(self):
@@ -457,10 +551,10 @@ class Device:
         --------
         nvx.structs.Gain
         """
-        gain = Gain()
+        gain = ctypes.c_int()
         handle_error(raw.NVXGetAuxGain(self.device_handle, ctypes.byref(gain)))
 
-        if gain == Gain.GAIN_1:
+        if gain.value == Gain.GAIN_1:
             return 1
         return 5
 
@@ -484,7 +578,6 @@ class Device:
         --------
         nvx.structs.Gain
         """
-        gain = Gain()
         if value == 1:
             gain = Gain.GAIN_1
         elif value == 5:
@@ -502,9 +595,9 @@ class Device:
         bool
             True if power save mode is enabled, False otherwise.
         """
-        ps = PowerSave()
+        ps = ctypes.c_int()
         handle_error(raw.NVXGetPowerSave(self.device_handle, ctypes.byref(ps)))
-        if ps == PowerSave.DISABLE:
+        if ps.value == PowerSave.DISABLE:
             return False
         return True
 
@@ -521,7 +614,7 @@ class Device:
         if value:
             ps = PowerSave.ENABLE
 
-        handle_error(raw.NVXSetPowerSave(self.device_handle, PowerSave(ps)))
+        handle_error(raw.NVXSetPowerSave(self.device_handle, ps))
 
     @property
     def impedance_data(self):
@@ -1,4 +1,5 @@
 """NVX Impedance data."""
+import numpy as np
 
 
 class Impedance:
@@ -8,7 +9,7 @@ class Impedance:
     """Invalid (not connected) impedance value."""
 
     def __init__(self, raw_data, count_eeg):
-        self.raw_data = raw_data
+        self.raw_data = np.ctypeslib.as_array(raw_data)
         self.count_eeg = count_eeg
 
     def channel(self, index):
@@ -32,9 +33,19 @@ class Impedance:
             raise ValueError(
                 "no channel with index " + str(index) + " (only " + str(self.count_eeg) + " channels present)")
 
-        result = self.raw_data[index]
-        if result == Impedance._INVALID:
-            return None
+        result = int(self.raw_data[index])
+        return None if result == Impedance._INVALID else result
+
+    def all_channels(self):
+        """Get impedance from all channels.
+
+        Returns
+        -------
+        numpy.ndarray
+            Impedance data of all channels as floats, with NaN for electrodes that are not connected.
+        """
+        result = self.raw_data[:self.count_eeg].astype(np.float64)
+        result[self.raw_data[:self.count_eeg] == Impedance._INVALID] = np.nan
         return result
 
     def ground(self):
@@ -45,7 +56,5 @@ class Impedance:
         int or None
             Impedance data, or None if the electrode is not connected.
         """
-        result = self.raw_data[self.count_eeg]
-        if result == Impedance._INVALID:
-            return None
-        return result
+        result = int(self.raw_data[self.count_eeg])
+        return None if result == Impedance._INVALID else result
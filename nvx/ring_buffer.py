@@ -3,6 +3,12 @@ import numpy as np
 
 
 class RingBuffer:
+    __slots__ = ("data", "_unwrap", "_capacity", "_mask", "_begin", "_size")
+
+    # Hot symbols, bound once to skip global and module attribute lookups per call
+    _np_copyto = staticmethod(np.copyto)
+    _np_asarray = staticmethod(np.asarray)
+
     def __init__(self, capacity: int, dtype=np.int32):
         """A linear ringbuffer array based on numpy.ndarray.
 
@@ -16,37 +22,47 @@ class RingBuffer:
         ----------
         capacity : int
             The maximum amount of elements this ringbuffer can hold, before it starts overwriting old elements.
+            Capacity is rounded up to the next power of two, so that indices can wrap around using a bitmask.
         dtype
-            Type of elements stored in the buffer.
+            Type of elements stored in the buffer. A sub-array type, like (numpy.int32, n), makes each element a row of
+            n values.
         """
+        capacity = 1 << (capacity - 1).bit_length()
         self.data = np.empty(capacity, dtype=dtype)
+        self._unwrap = None  # Holds unwrapped data, when as_array is called on bifurcated data. Allocated on first use
+        self._capacity = capacity
+        self._mask = capacity - 1
         self._begin = 0
         self._size = 0
 
-        self.clear()
-
     def as_array(self):
         """Convert data to a numpy array.
+        If the data is contiguous, returns a view into it. Otherwise, the data is unwrapped into an internal buffer,
+        allocated once on the first such call, and a view into that buffer is returned.
 
         Warnings
         --------
-        Since numpy arrays must store contiguous data only, this function will always perform a copy of the data. If you
-        are sure your data can be represented as a view (self.is_contiguous() returns True) use as_array_view instead.
+        The returned array does not own its data. It is only valid until the ring buffer is modified or as_array is
+        called again. Use numpy.copy on the result if you need to keep it.
 
         Returns
         -------
         numpy.ndarray
-            A copy of the data in a flat numpy array. Array's size will not be larger than ringbuf's size.
+            A view of the data in a flat numpy array. Array's size will not be larger than ringbuf's size.
         """
-        if self.is_contiguous():
-            # Return a copy via copy
-            return np.copy(self.data[self._begin:(self._begin + self.size)])
+        begin = self._begin
+        end = begin + self._size
+        if end <= self._capacity:
+            # Return a view
+            return self.data[begin:end]
         else:
-            # Return a copy via numpy.concatenate
-            return np.concatenate((
-                self.data[self._begin:self.capacity],
-                self.data[0:((self._begin + self.size) % self.capacity)]
-            ))
+            # Unwrap the data into the unwrap buffer: two copies, and no allocation after the first call
+            if self._unwrap is None:
+                self._unwrap = np.empty_like(self.data)
+            head = self._capacity - begin
+            self._np_copyto(self._unwrap[:head], self.data[begin:])
+            self._np_copyto(self._unwrap[head:self._size], self.data[:(end & self._mask)])
+            return self._unwrap[:self._size]
 
     def as_array_view(self):
         """Convert data to a numpy array view.
@@ -54,7 +70,7 @@ class RingBuffer:
         Warnings
         --------
         Since numpy arrays must store contiguous data only, this function will fail if self.is_contiguous() returns
-        False. If you would like the function to copy if the data is bifurcated, use as_array instead.
+        False. If you would like the function to unwrap the data if it is bifurcated, use as_array instead.
 
         Raises
         ------
@@ -66,9 +82,11 @@ class RingBuffer:
         numpy.ndarray
             A view of the data in a flat numpy array. Array's size will not be larger than ringbuf's size.
         """
-        if self.is_contiguous():
+        begin = self._begin
+        end = begin + self._size
+        if end <= self._capacity:
             # Return a view
-            return self.data[self._begin:(self._begin + self.size)]
+            return self.data[begin:end]
         else:
             raise BufferError("ring buffer array is bifurcated")
 
@@ -80,7 +98,7 @@ class RingBuffer:
         bool
             True if all data is in a contiguous chunk of memory, False otherwise.
         """
-        return self._begin + self.size <= self.capacity
+        return self._begin + self._size <= self._capacity
 
     def __len__(self):
         """Return the amount of elements the ringbuffer holds.
@@ -98,7 +116,7 @@ class RingBuffer:
     @property
     def capacity(self):
         """Return current maximum capacity of the ring buffer."""
-        return self.data.shape[0]
+        return self._capacity
 
     def __getitem__(self, index: int):
         """Retrieve an element from the buffer.
@@ -119,12 +137,13 @@ class RingBuffer:
         value
             Retrieved value.
         """
-        if 0 <= index < self.size:
-            return self.data[(self._begin + index) % self.capacity]
-        elif -self.size <= index < 0:
-            return self.data[(self._begin + self.size + index) % self.capacity]
+        size = self._size
+        if -size <= index < size:
+            if index < 0:
+                index += size
+            return self.data[(self._begin + index) & self._mask]
         else:
-            raise IndexError("index " + str(index) + " is out of bounds for size " + str(self.size))
+            raise IndexError("index " + str(index) + " is out of bounds for size " + str(size))
 
     def __setitem__(self, index: int, value):
         """Retrieve an element from the buffer.
@@ -142,12 +161,13 @@ class RingBuffer:
         IndexError
             If the index is out of bounds [0, size()).
         """
-        if 0 <= index < self.size:
-            self.data[(self._begin + index) % self.capacity] = value
-        elif -self.size <= index < 0:
-            self.data[(self._begin + self.size + index) % self.capacity] = value
+        size = self._size
+        if -size <= index < size:
+            if index < 0:
+                index += size
+            self.data[(self._begin + index) & self._mask] = value
         else:
-            raise IndexError("index " + str(index) + " is out of bounds for size " + str(self.size))
+            raise IndexError("index " + str(index) + " is out of bounds for size " + str(size))
 
     def append(self, value):
         """Append an item to the ring buffer.
@@ -159,33 +179,67 @@ class RingBuffer:
         value
             A value to append.
         """
-        self.data[(self._begin + self.size) % self.capacity] = value
-        if self.size == self.capacity:
-            self._begin = (self._begin + 1) % self.capacity
+        size = self._size
+        self.data[(self._begin + size) & self._mask] = value
+        if size == self._capacity:
+            self._begin = (self._begin + 1) & self._mask
         else:
-            self._size += 1
+            self._size = size + 1
 
     def extend(self, iterable):
         """Extend the ring buffer with new items.
         Appending elements does not increase the buffer's capacity. If the ring buffer is full, newest element will
         overwrite the oldest.
 
+        Arrays (numpy.ndarray or objects implementing __array__) and buffers (bytes, memoryview) are converted to a
+        numpy array once, and copied into the buffer with at most two slice assignments. Other iterables, including
+        lists and tuples, are appended element by element.
+
         Parameters
         ----------
         iterable
             An iterable to traverse and read values from.
         """
-        for value in iterable:
-            self.append(value)
+        if isinstance(iterable, (bytes, bytearray)):
+            iterable = np.frombuffer(iterable, dtype=np.uint8)
+        elif not (isinstance(iterable, (np.ndarray, memoryview)) or hasattr(iterable, "__array__")):
+            for value in iterable:
+                self.append(value)
+            return
+
+        values = self._np_asarray(iterable, dtype=self.data.dtype)
+        count = len(values)
+        capacity = self._capacity
+
+        if count == 0:
+            return
+
+        if count >= capacity:
+            # Only the last `capacity` values survive
+            self.data[:] = values[count - capacity:]
+            self._begin = 0
+            self._size = capacity
+            return
+
+        end = (self._begin + self._size) & self._mask
+        first = min(count, capacity - end)
+        self.data[end:end + first] = values[:first]
+        self.data[:count - first] = values[first:]
+
+        overflow = self._size + count - capacity
+        if overflow > 0:
+            self._begin = (self._begin + overflow) & self._mask
+            self._size = capacity
+        else:
+            self._size += count
 
     def clear(self):
         """Clear all data from the buffer.
-        If dtype of underlying array is object, fills the capacity with None. Otherwise fills it with zeros.
+        If dtype of underlying array is object, fills the capacity with None, releasing the references. Otherwise the
+        underlying array is left as is, since no element outside of [0, size()) is ever read.
         """
-        if self.data.dtype is object:
+        if self.data.dtype == object:
             self.data.fill(None)
-        else:
-            self.data.fill(0)
         self._begin = 0
         self._size = 0
 
@@ -195,4 +249,39 @@ class RingBuffer:
         return self.data.dtype
 
     def __repr__(self):
-        return repr(self.data)
+        # Not as_array: unwrapping would overwrite the internal buffer, invalidating arrays returned by as_array
+        begin = self._begin
+        end = begin + self._size
+        if end <= self._capacity:
+            return repr(self.data[begin:end])
+        return repr(np.concatenate((self.data[begin:], self.data[:(end & self._mask)])))
+
+
+class ChannelRingBuffer(RingBuffer):
+    __slots__ = ()
+
+    def __init__(self, capacity: int, n_channels: int, dtype=np.int32):
+        """A ring buffer of rows, each holding one value per channel.
+
+        Data is stored in a 2D numpy.ndarray of shape (capacity, n_channels), in C order: each row is contiguous. All
+        RingBuffer operations work on whole rows - `append()` takes a row, `extend()` takes a 2D array of rows, and
+        `as_array()` returns an array of shape (size, n_channels).
+
+        In pynvx the buffer is used to hold raw sample records, one row per sample.
+
+        Parameters
+        ----------
+        capacity : int
+            The maximum amount of rows this ringbuffer can hold, before it starts overwriting old rows.
+            Capacity is rounded up to the next power of two, so that indices can wrap around using a bitmask.
+        n_channels : int
+            Amount of values in each row.
+        dtype
+            Type of values stored in the buffer.
+        """
+        super().__init__(capacity, dtype=(dtype, n_channels))
+
+    @property
+    def n_channels(self):
+        """Amount of values in each row."""
+        return self.data.shape[1]
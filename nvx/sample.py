@@ -1,11 +1,60 @@
 """NVX Data sample."""
 import ctypes
+from functools import lru_cache
+import operator
 import numpy as np
 from .channel_names import eeg_channel, aux_channel
 
+# Maps every EEG and AUX channel name to (is_aux, index)
+_channel_index = {name: (False, index) for name, index in eeg_channel.items()}
+_channel_index.update({name: (True, index) for name, index in aux_channel.items()})
+
+
+@lru_cache()
+def _channel_offsets(eeg_count, aux_count):
+    """Map names of channels present in a sample to their absolute indexes in Sample.data.
+
+    Parameters
+    ----------
+    eeg_count : int
+        Amount of present EEG channels.
+    aux_count : int
+        Amount of present AUX channels.
+
+    Returns
+    -------
+    dict
+        A mapping from channel name to index.
+    """
+    result = {name: index for name, index in eeg_channel.items() if index < eeg_count}
+    result.update({name: eeg_count + index for name, index in aux_channel.items() if index < aux_count})
+    return result
+
+
+class _SampleTail(ctypes.Structure):
+    """Fields that follow the EEG and AUX data in a raw sample."""
+    _fields_ = [
+        ('status', ctypes.c_uint32),  # digital inputs (bits 0 - 7) + output (bits 8 - 15) state + 16 MSB reserved bits
+        ('counter', ctypes.c_uint32)  # data sequencing cyclic counter for checking for data loss
+    ]
+
+
+# Status bitfield masks of input (bits 0 - 7) and output (bits 8 - 15) channels, used by the *_status_all methods
+_INPUT_MASKS = np.array([1 << i for i in range(8)], dtype=np.uint32)
+_OUTPUT_MASKS = _INPUT_MASKS << 8
+
 
 class Sample:
-    def __init__(self, raw_data, eeg_count, aux_count):
+    __slots__ = ("record", "data", "eeg_count", "aux_count", "_eeg_view", "_aux_view", "_status", "counter")
+
+    # Hot symbols, bound once to skip global and module attribute lookups per sample
+    _c_int32 = ctypes.c_int32
+    _tail_from_address = _SampleTail.from_address
+    _np_as_array = staticmethod(np.ctypeslib.as_array)
+    _np_array = staticmethod(np.array)
+    _np_uint32 = np.uint32
+
+    def __init__(self, raw_data, eeg_count, aux_count, copy=False):
         """A data slice returned by nvx.device.Device
         This class is not intended to be constructed manually. An instance is returned by nvx.device.Device._get_data
         function or as part of an array in nvx.device.Device.pull_chunk.
@@ -18,24 +67,112 @@ class Sample:
             Amount of present EEG channels.
         aux_count : int
             Amount of present AUX channels.
+        copy : bool
+            If True, data is copied out of raw_data, which can then be released or reused right away. Otherwise
+            (default), the sample is a view into raw_data, and raw_data must outlive it.
         """
         size = eeg_count + aux_count
-        ctypes_array = (ctypes.c_int32 * size).from_address(raw_data.value)
+        ctypes_array = (self._c_int32 * (size + 2)).from_address(raw_data.value)
 
         # TODO: Add local counter
         # TODO: Add time pulled
+        # Numpy array representation of the whole record, as laid out by the driver: EEG, AUX, status, counter
+        if copy:
+            self.record = self._np_array(ctypes_array, dtype=self._c_int32)
+        else:
+            self.record = self._np_as_array(ctypes_array)
         # Numpy array representation of the EEG and AUX data
-        self.data = np.ctypeslib.as_array(ctypes_array)
+        self.data = self.record[:size]
         self.eeg_count = eeg_count
         self.aux_count = aux_count
+        self._eeg_view = self.data[:eeg_count]
+        self._aux_view = self.data[eeg_count:size]
+
+        # Status and counter follow the EEG and AUX data
+        tail = self._tail_from_address(raw_data.value + size * 4)
 
         # Status bitfield: digital inputs (bits 0 - 7) + output (bits 8 - 15) state + 16 MSB reserved bits
-        self._status = ctypes.cast(raw_data.value + self.eeg_count * 4 + self.aux_count * 4,
-                                   ctypes.POINTER(ctypes.c_uint))[0]
+        self._status = tail.status
 
         # Data sequencing cyclic counter for checking for data loss.
-        self.counter = ctypes.cast(raw_data.value + self.eeg_count * 4 + self.aux_count * 4 + 4,
-                                   ctypes.POINTER(ctypes.c_uint))[0]
+        self.counter = tail.counter
+
+    @classmethod
+    def from_record(cls, record, eeg_count, aux_count):
+        """Construct a sample from an already extracted record.
+        Unlike the constructor, this does not touch the driver's memory: the sample becomes a view into `record`.
+
+        Parameters
+        ----------
+        record : numpy.ndarray
+            A flat int32 array of size eeg_count + aux_count + 2, laid out like the driver's raw data.
+        eeg_count : int
+            Amount of present EEG channels.
+        aux_count : int
+            Amount of present AUX channels.
+
+        Returns
+        -------
+        nvx.sample.Sample
+        """
+        size = eeg_count + aux_count
+
+        self = cls.__new__(cls)
+        self.record = record
+        self.data = record[:size]
+        self.eeg_count = eeg_count
+        self.aux_count = aux_count
+        self._eeg_view = self.data[:eeg_count]
+        self._aux_view = self.data[eeg_count:size]
+        self._status, self.counter = (int(x) for x in record[size:size + 2].view(cls._np_uint32))
+        return self
+
+    @classmethod
+    def from_chunk(cls, raw_data, n_samples, eeg_count, aux_count):
+        """Wrap a raw chunk of consecutive samples returned by the driver.
+        The whole chunk is wrapped as a single 2D numpy array, without any per-sample work.
+
+        Parameters
+        ----------
+        raw_data
+            A raw array of n_samples consecutive samples returned by the driver.
+        n_samples : int
+            Amount of samples in the chunk.
+        eeg_count : int
+            Amount of present EEG channels.
+        aux_count : int
+            Amount of present AUX channels.
+
+        Returns
+        -------
+        nvx.sample.SampleChunk
+        """
+        record_size = eeg_count + aux_count + 2
+        ctypes_array = (ctypes.c_int32 * (n_samples * record_size)).from_address(raw_data.value)
+        records = np.ctypeslib.as_array(ctypes_array).reshape(n_samples, record_size)
+        return SampleChunk(records, eeg_count, aux_count)
+
+    @property
+    def eeg_view(self):
+        """Data from all EEG channels.
+
+        Returns
+        -------
+        numpy.ndarray
+            A view into the sample's data (no copy is made).
+        """
+        return self._eeg_view
+
+    @property
+    def aux_view(self):
+        """Data from all AUX channels.
+
+        Returns
+        -------
+        numpy.ndarray
+            A view into the sample's data (no copy is made).
+        """
+        return self._aux_view
 
     def eeg_data(self, index):
         """Get data from an EEG channel.
@@ -44,18 +181,43 @@ class Sample:
         ----------
         index : int
 
+        Raises
+        ------
+        ValueError
+            If index is not in range [0, eeg_count).
+
         Returns
         -------
         int
             Requested data.
         """
-        if index >= self.eeg_count:
+        if not 0 <= index < self.eeg_count:
             raise ValueError(
                 "no channel with index " + str(index)
                 + " (only " + str(self.eeg_count) + " eeg channels present)")
 
         return self.data[index]
 
+    def eeg_data_many(self, indices):
+        """Get data from several EEG channels at once.
+
+        Parameters
+        ----------
+        indices : array_like of int
+            Channel indexes. Like in numpy, negative indexes count from the last channel.
+
+        Raises
+        ------
+        IndexError
+            If any index is out of bounds.
+
+        Returns
+        -------
+        numpy.ndarray
+            Requested data, in the order of indices.
+        """
+        return self._eeg_view.take(np.asarray(indices), mode="raise")
+
     def aux_data(self, index):
         """Get data from an aux channel.
         
@@ -63,18 +225,43 @@ class Sample:
         ----------
         index : int
 
+        Raises
+        ------
+        ValueError
+            If index is not in range [0, aux_count).
+
         Returns
         -------
         int
             Requested data.
         """
-        if index >= self.aux_count:
+        if not 0 <= index < self.aux_count:
             raise ValueError(
                 "no aux channel with index " + str(index)
                 + " (only " + str(self.aux_count) + " aux channels present)")
 
         return self.data[self.eeg_count + index]
 
+    def aux_data_many(self, indices):
+        """Get data from several AUX channels at once.
+
+        Parameters
+        ----------
+        indices : array_like of int
+            Channel indexes. Like in numpy, negative indexes count from the last channel.
+
+        Raises
+        ------
+        IndexError
+            If any index is out of bounds.
+
+        Returns
+        -------
+        numpy.ndarray
+            Requested data, in the order of indices.
+        """
+        return self._aux_view.take(np.asarray(indices), mode="raise")
+
     def __getitem__(self, channel_name):
         """Get data from an EEG or AUX channel by name.
 
@@ -87,16 +274,24 @@ class Sample:
         ------
         KeyError
             if channel_name is not a valid EEG/AUX channel name
+        ValueError
+            if the channel is not present in this sample
 
         Returns
         -------
         int
             Requested data.
         """
-        if channel_name in eeg_channel:
-            return self.eeg_data(eeg_channel[channel_name])
+        offset = _channel_offsets(self.eeg_count, self.aux_count).get(channel_name)
+        if offset is not None:
+            return self.data[offset]
+
+        # Channel is either invalid or not present: let the accessors raise a descriptive error
+        is_aux, index = _channel_index[channel_name]
+        if is_aux:
+            return self.aux_data(index)
         else:
-            return self.aux_data(aux_channel[channel_name])
+            return self.eeg_data(index)
 
     def input_status(self, index):
         """Get the digital status of an input channel.
@@ -119,7 +314,17 @@ class Sample:
             raise ValueError("invalid index " + str(index) + ": there are 8 input channels")
 
         # TODO: verify bit ordering (current: lowest first)
-        return bool(self._status & (1 << index))
+        return bool((self._status >> index) & 1)
+
+    def input_status_all(self):
+        """Get the digital status of all input channels.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of 8 bools, one for each channel.
+        """
+        return (np.uint32(self._status) & _INPUT_MASKS).astype(bool)
 
     def output_status(self, index):
         """Get the digital status of an output channel.
@@ -142,4 +347,120 @@ class Sample:
             raise ValueError("invalid index " + str(index) + ": there are 8 output channels")
 
         # TODO: verify bit ordering (current: lowest first)
-        return self._status & (1 << 8 << index)
+        return bool((self._status >> (8 + index)) & 1)
+
+    def output_status_all(self):
+        """Get the digital status of all output channels.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of 8 bools, one for each channel.
+        """
+        return (np.uint32(self._status) & _OUTPUT_MASKS).astype(bool)
+
+
+class SampleChunk:
+    __slots__ = ("records", "eeg_count", "aux_count")
+
+    def __init__(self, records, eeg_count, aux_count):
+        """A chunk of consecutive samples, stored as a single 2D numpy array.
+        This class is not intended to be constructed manually. An instance is returned by nvx.sample.Sample.from_chunk
+        or nvx.device.Device.pull_chunk.
+
+        Columns of the chunk can be accessed as numpy arrays via properties. Indexing or iterating the chunk produces
+        nvx.sample.Sample objects, which are constructed on demand as views into the chunk's rows.
+
+        Parameters
+        ----------
+        records : numpy.ndarray
+            A 2D int32 array of shape (n_samples, eeg_count + aux_count + 2), each row laid out like the driver's raw
+            data: EEG, AUX, status, counter.
+        eeg_count : int
+            Amount of present EEG channels.
+        aux_count : int
+            Amount of present AUX channels.
+        """
+        self.records = records
+        self.eeg_count = eeg_count
+        self.aux_count = aux_count
+
+    @property
+    def eeg(self):
+        """EEG data of all samples, in an array of shape (n_samples, eeg_count)."""
+        return self.records[:, :self.eeg_count]
+
+    @property
+    def aux(self):
+        """AUX data of all samples, in an array of shape (n_samples, aux_count)."""
+        return self.records[:, self.eeg_count:(self.eeg_count + self.aux_count)]
+
+    @property
+    def status(self):
+        """Status bitfields of all samples, in an array of shape (n_samples,). See Sample.input_status."""
+        return self.records[:, self.eeg_count + self.aux_count].view(np.uint32)
+
+    @property
+    def counters(self):
+        """Sequencing counters of all samples, in an array of shape (n_samples,)."""
+        return self.records[:, self.eeg_count + self.aux_count + 1].view(np.uint32)
+
+    def select(self, eeg_indices=(), aux_indices=()):
+        """Get data from several channels of all samples at once.
+        All requested channels are gathered with a single fancy-indexing copy.
+
+        Parameters
+        ----------
+        eeg_indices : array_like of int
+            EEG channel indexes. Like in numpy, negative indexes count from the last channel.
+        aux_indices : array_like of int
+            AUX channel indexes. Like in numpy, negative indexes count from the last channel.
+
+        Raises
+        ------
+        IndexError
+            If any index is out of bounds.
+
+        Returns
+        -------
+        numpy.ndarray
+            Requested data, in an array of shape (n_samples, len(eeg_indices) + len(aux_indices)). Columns hold EEG
+            channels in the order of eeg_indices, followed by AUX channels in the order of aux_indices.
+        """
+        # Resolve channel indexes to record columns, checking bounds and wrapping negative indexes like numpy
+        eeg_columns = np.arange(self.eeg_count).take(np.asarray(eeg_indices, dtype=np.intp), mode="raise")
+        aux_columns = np.arange(self.eeg_count, self.eeg_count + self.aux_count).take(
+            np.asarray(aux_indices, dtype=np.intp), mode="raise")
+
+        return self.records[:, np.concatenate((eeg_columns, aux_columns))]
+
+    def __len__(self):
+        return self.records.shape[0]
+
+    def __getitem__(self, index):
+        """Get a sample, or a slice of samples, from the chunk.
+
+        Parameters
+        ----------
+        index : int or slice
+
+        Raises
+        ------
+        TypeError
+            If index is neither an integer nor a slice.
+        IndexError
+            If index is out of range.
+
+        Returns
+        -------
+        nvx.sample.Sample or nvx.sample.SampleChunk
+            A sample viewing the chunk's row, or a chunk viewing the sliced rows.
+        """
+        if isinstance(index, slice):
+            return SampleChunk(self.records[index], self.eeg_count, self.aux_count)
+
+        return Sample.from_record(self.records[operator.index(index)], self.eeg_count, self.aux_count)
+
+    def __iter__(self):
+        for record in self.records:
+            yield Sample.from_record(record, self.eeg_count, self.aux_count)
@@ -1,11 +1,19 @@
-"""A collection of wrappers for C structs defined by the driver."""
+"""A collection of wrappers for C structs and enums defined by the driver.
+Enums are plain IntEnums. In structures, enum fields are stored as ctypes.c_int and can be converted back to their enum
+type on read, ex.: Mode(settings.mode).
+
+Structures declared by the driver header under #pragma pack(1) set _pack_ = 1, so that their layout matches the DLL's.
+Enums are int-sized in the header, so they are not downsized.
+"""
 import ctypes
-from .c_enum import CEnum
+from enum import IntEnum
+import numpy as np
 from .globals import DEVICES_COUNT_MAX
 
 
 class Version(ctypes.Structure):
     """Version info about NVX."""
+    _pack_ = 1
     _fields_ = [
         ('dll', ctypes.c_ulonglong),
         ('driver', ctypes.c_ulonglong),
@@ -16,7 +24,7 @@ class Version(ctypes.Structure):
     ]
 
 
-class Mode(CEnum):
+class Mode(IntEnum):
     """Mode enum."""
     NORMAL = 0  # normal data acquisition
     ACTIVE_SHIELD = 1  # data acquisition with ActiveShield
@@ -26,20 +34,20 @@ class Mode(CEnum):
     IMP_GND = 5  # impedance measure, all electrodes connected to gnd
 
 
-class Rate(CEnum):
+class Rate(IntEnum):
     """Samples rate (physical) enum."""
     KHZ_10 = 0  # 10 kHz, all channels (default mode)
     KHZ_50 = 1  # 50 kHz, all channels
     KHZ_100 = 2  # 100 kHz, max 64 channels
 
 
-class AdcFilter(CEnum):
+class AdcFilter(IntEnum):
     """ADC data filter, obsolete, not used."""
     NATIVE = 0  # no ADC data filter
     AVERAGING_2 = 1  # ADC data moving averaging filter by 2 samples
 
 
-class Decimation(CEnum):
+class Decimation(IntEnum):
     """ADC data decimation."""
     DCM_0 = 0  # no decimation
     DCM_2 = 2  # decimation by 2
@@ -50,16 +58,18 @@ class Decimation(CEnum):
 
 
 class Settings(ctypes.Structure):
+    _pack_ = 1
     _fields_ = [
-        ('mode', Mode),  # mode of acquisition
-        ('rate', Rate),  # samples rate
-        ('adc_filter', AdcFilter),  # ADC data filter, obsolete, not used
-        ('decimation', Decimation),  # media converter fpga
+        ('mode', ctypes.c_int),  # mode of acquisition, see Mode
+        ('rate', ctypes.c_int),  # samples rate, see Rate
+        ('adc_filter', ctypes.c_int),  # ADC data filter, obsolete, not used, see AdcFilter
+        ('decimation', ctypes.c_int),  # media converter fpga, see Decimation
     ]
 
 
 class Property(ctypes.Structure):
     """Device property structure."""
+    _pack_ = 1
     _fields_ = [
         ('count_eeg', ctypes.c_uint),  # numbers of Eeg channels
         ('count_aux', ctypes.c_uint),  # numbers of Aux channels
@@ -73,13 +83,13 @@ class Property(ctypes.Structure):
     ]
 
 
-class Gain(CEnum):
+class Gain(IntEnum):
     """Device gain structure."""
     GAIN_1 = 0  # gain = 1
     GAIN_5 = 1  # gain = 5
 
 
-class PowerSave(CEnum):
+class PowerSave(IntEnum):
     """Device power saving structure."""
     DISABLE = 0  # power save disable
     ENABLE = 1  # power save enable, only 64 Eeg channels and Aux
@@ -87,6 +97,7 @@ class PowerSave(CEnum):
 
 class DataStatus(ctypes.Structure):
     """Device property structure."""
+    _pack_ = 1
     _fields_ = [
         ('samples', ctypes.c_uint),  # total samples
         ('errors', ctypes.c_uint),  # total errors
@@ -97,6 +108,7 @@ class DataStatus(ctypes.Structure):
 
 class ErrorStatus(ctypes.Structure):
     """Device error status."""
+    _pack_ = 1
     _fields_ = [
         ('samples', ctypes.c_uint),  # total samples
         ('crc', ctypes.c_uint),  # crc errors on data samples
@@ -104,22 +116,29 @@ class ErrorStatus(ctypes.Structure):
         ('devices', ctypes.c_uint * DEVICES_COUNT_MAX)  # errors on devices
     ]
 
+    @property
+    def devices_np(self):
+        """Errors on devices as a numpy array. The array is a view into the structure (no copy is made)."""
+        return np.frombuffer(self.devices, dtype=np.uint32)
+
 
 class ImpedanceSetup(ctypes.Structure):
     """Impedance setup structure.
 
     Between Good and Bad level is indicate as both leds (yellow emulation).
     """
+    _pack_ = 1
     _fields_ = [
         ('good', ctypes.c_uint),  # good level (green led indication), Ohm
         ('bad', ctypes.c_uint),  # bad level (red led indication), Ohm
         ('leds_disable', ctypes.c_uint),  # disable electrode's LEDs, if not zero
-        ('timeout', ctypes.c_uint * DEVICES_COUNT_MAX)  # impedance mode timeout (0 - 65535), sec
+        ('timeout', ctypes.c_uint)  # impedance mode timeout (0 - 65535), sec
     ]
 
 
 class ImpedanceMode(ctypes.Structure):
     """Impedance control structure."""
+    _pack_ = 1
     _fields_ = [
         # read-write information
         ('splitter', ctypes.c_uint),  # Current splitter for impedance measure, (0 .. splitters - 1).
@@ -133,7 +152,7 @@ class ImpedanceMode(ctypes.Structure):
     ]
 
 
-class ScanFreq(CEnum):
+class ScanFreq(IntEnum):
     """Impedance scanning frequency structure."""
     HZ_30 = 0  # freq = 30 Hz
     HZ_80 = 1  # freq = 80 Hz
@@ -141,12 +160,14 @@ class ScanFreq(CEnum):
 
 class ImpedanceSettings(ctypes.Structure):
     """Impedance settings structure."""
+    _pack_ = 1
     _fields_ = [
-        ('scan_freq', ScanFreq),  # scanning frequency
+        ('scan_freq', ctypes.c_int),  # scanning frequency, see ScanFreq
     ]
 
 
 class Voltages(ctypes.Structure):
+    _pack_ = 1
     _fields_ = [
         ('VDC', ctypes.c_float),  # power supply, V
         ('AVDD5A1', ctypes.c_float),  # analog-1 5.0, V
@@ -167,11 +188,12 @@ class Voltages(ctypes.Structure):
 
 class FrequencyBandwidth(ctypes.Structure):
     """Frequency bandwidth structure."""
+    _pack_ = 1
     _fields_ = [
         ('sample_rate', ctypes.c_uint),  # sample rate of device, mHz
         ('cutoff_freq', ctypes.c_uint),  # cutoff frequency of the -3 dB, mHz
-        ('decim_from_rate', Rate),  # decimation from rate
-        ('decimation', Decimation),  # decimation value
+        ('decim_from_rate', ctypes.c_int),  # decimation from rate, see Rate
+        ('decimation', ctypes.c_int),  # decimation value, see Decimation
     ]
 
 
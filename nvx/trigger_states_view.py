@@ -1,11 +1,25 @@
 """Array-like views into device's triggers."""
 import ctypes
-from .bit_view import BitView
+import numpy as np
 from .utility import handle_error
 from .base import raw
+from . import _trigger_jit
+
+# Precomputed trigger keys, mapped to (is_output, index)
+_STR_KEYS = {prefix + str(i): (prefix == 'o', i) for prefix in "io" for i in range(8)}
+_TUPLE_KEYS = {(name, i): (name == "output", i) for name in ("input", "output") for i in range(8)}
+_KEYS = {**_STR_KEYS, **_TUPLE_KEYS}
+
+# Masks of output triggers in the trigger bitfield, by output trigger index. Output triggers are bits [8, 16)
+_OUTPUT_BITS = tuple(1 << (8 + i) for i in range(8))
+
+# Format of str(TriggerStatesView), same as str(dict(view)): "{'i0': True, ..., 'o7': False}"
+_STR_TEMPLATE = "{{" + ", ".join("'" + key + "': {}" for key in _STR_KEYS) + "}}"
 
 
 class ITriggerStatesView:
+    __slots__ = ("_value",)
+
     def __init__(self, device):
         """Provides an array-like view to device's input triggers.
         Input triggers cannot be set, thus this class does not have __setitem__.
@@ -23,14 +37,15 @@ class ITriggerStatesView:
         Unlike OTriggerStatesView, this class stores a cached version of triggers and not a device to look them up.
         Since input triggers cannot be modified, they can be safely copied in the constructor.
         """
-        self.triggers = BitView(ctypes.c_uint(0), 0, 8)  # Observe only bits [0, 8)
-        handle_error(raw.NVXGetTriggers(device.device_handle, ctypes.byref(self.triggers.value)))
+        triggers = ctypes.c_uint(0)
+        handle_error(raw.NVXGetTriggers(device.device_handle, ctypes.byref(triggers)))
+        self._value = triggers.value & 0xFF  # Keep only bits [0, 8)
 
     def __len__(self):
         return 8
 
     def __str__(self):
-        return str(self.triggers)
+        return str(list(self))
 
     def __getitem__(self, index):
         """Get a trigger state.
@@ -39,17 +54,27 @@ class ITriggerStatesView:
         ----------
         index : int
 
+        Raises
+        ------
+        IndexError
+            if index is not in range [0, 8)
+
         Returns
         -------
         bool
             trigger state
         """
-        return self.triggers[index]
+        if not 0 <= index < 8:
+            raise IndexError("Index (" + str(index) + ") not in range [0, 8)")
+
+        return bool((self._value >> index) & 1)
 
     # No __setitem__: input triggers are const
 
 
 class OTriggerStatesView:
+    __slots__ = ("device", "_raw")
+
     def __init__(self, device):
         """Provides an array-like view to device's output triggers.
         Unlike ITriggerStatesView, output triggers can be modified.
@@ -57,6 +82,8 @@ class OTriggerStatesView:
         This class is not intended to be constructed manually. An instance is returned by TriggerStatesView.output
         property.
 
+        Several writes can be batched into one driver call with batch(), see OTriggerStatesBatch.
+
         Parameters
         ----------
         device : nvx.device.Device
@@ -64,6 +91,9 @@ class OTriggerStatesView:
         """
         self.device = device
 
+        # Reusable buffer for reading and writing triggers. Output triggers are bits [8, 16)
+        self._raw = ctypes.c_uint(0)
+
     def __len__(self):
         return 8
 
@@ -77,6 +107,11 @@ class OTriggerStatesView:
         ----------
         index : int
 
+        Raises
+        ------
+        IndexError
+            if index is not in range [0, 8)
+
         Returns
         -------
         bool
@@ -87,9 +122,11 @@ class OTriggerStatesView:
         Unfortunately, trigger values cannot be cached, since output triggers can be modified from different instances
         of OTriggerStatesView.
         """
-        triggers = BitView(ctypes.c_uint(0), 8, 16)  # Observe only bits [8, 16)
-        handle_error(raw.NVXGetTriggers(self.device.device_handle, ctypes.byref(triggers.value)))
-        return triggers[index]
+        if not 0 <= index < 8:
+            raise IndexError("Index (" + str(index) + ") not in range [0, 8)")
+
+        handle_error(raw.NVXGetTriggers(self.device.device_handle, ctypes.byref(self._raw)))
+        return bool(self._raw.value & _OUTPUT_BITS[index])
 
     def __setitem__(self, index, x):
         """Set an output trigger.
@@ -104,15 +141,148 @@ class OTriggerStatesView:
         IndexError
             if index is not in range [0, 8)
         """
-        triggers = BitView(ctypes.c_uint(0), 8, 16)  # Observe only bits [8, 16)
-        handle_error(raw.NVXGetTriggers(self.device.device_handle, ctypes.byref(triggers.value)))
+        if not 0 <= index < 8:
+            raise IndexError("Index (" + str(index) + ") not in range [0, 8)")
+
+        mask = _OUTPUT_BITS[index]
+        handle_error(raw.NVXGetTriggers(self.device.device_handle, ctypes.byref(self._raw)))
+        self._raw.value = (self._raw.value & ~mask) | (mask & -bool(x))
+        handle_error(raw.NVXSetTriggers(self.device.device_handle, self._raw))
+
+    def set_bits(self, mask, values):
+        """Set several output triggers at once.
+        Triggers are read and written once, regardless of how many of them are set.
+
+        Parameters
+        ----------
+        mask : int
+            Bitmask of triggers to set: bit i selects output trigger i.
+        values : int
+            New trigger states: bit i is the state of output trigger i. Bits not selected by `mask` are ignored.
+
+        Raises
+        ------
+        ValueError
+            if mask is not in range [0, 256)
+        """
+        if not 0 <= mask < 256:
+            raise ValueError("Mask (" + str(mask) + ") not in range [0, 256)")
 
-        triggers[index] = x
+        handle_error(raw.NVXGetTriggers(self.device.device_handle, ctypes.byref(self._raw)))
+        self._raw.value = (self._raw.value & ~(mask << 8)) | ((values & mask) << 8)
+        handle_error(raw.NVXSetTriggers(self.device.device_handle, self._raw))
 
-        handle_error(raw.NVXSetTriggers(self.device.device_handle, triggers.value))
+    def batch(self):
+        """Start a batch of writes to output triggers, sent to the device with one driver call.
+
+        Returns
+        -------
+        OTriggerStatesBatch
+            A new batch, to be used as a context manager.
+        """
+        return OTriggerStatesBatch(self.device)
+
+
+class OTriggerStatesBatch:
+    __slots__ = ("device", "_raw")
+
+    def __init__(self, device):
+        """A batch of writes to device's output triggers.
+        The batch is a context manager. Triggers are read once on entering the block, and written once when the block
+        exits without an exception:
+
+            with triggers.output_batch() as output:
+                output[0] = True
+                output[3] = False
+
+        Inside the block, reads and writes only touch the batch's own pending value, and nothing is sent to the device.
+        Writes made through other views during the block are overwritten when the batch is written.
+
+        This class is not intended to be constructed manually. An instance is returned by OTriggerStatesView.batch and
+        TriggerStatesView.output_batch.
+
+        Parameters
+        ----------
+        device : nvx.device.Device
+            NVX device. See nvx.device
+        """
+        self.device = device
+
+        # Pending trigger bitfield. Output triggers are bits [8, 16)
+        self._raw = ctypes.c_uint(0)
+
+    def __enter__(self):
+        handle_error(raw.NVXGetTriggers(self.device.device_handle, ctypes.byref(self._raw)))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            handle_error(raw.NVXSetTriggers(self.device.device_handle, self._raw))
+
+    def __len__(self):
+        return 8
+
+    def __str__(self):
+        return str(list(self))
+
+    def __getitem__(self, index):
+        """Get a pending trigger state.
+
+        Parameters
+        ----------
+        index : int
+
+        Raises
+        ------
+        IndexError
+            if index is not in range [0, 8)
+
+        Returns
+        -------
+        bool
+            trigger state
+        """
+        if not 0 <= index < 8:
+            raise IndexError("Index (" + str(index) + ") not in range [0, 8)")
+
+        return bool(self._raw.value & _OUTPUT_BITS[index])
+
+    def __setitem__(self, index, x):
+        """Set a pending output trigger.
+
+        Parameters
+        ----------
+        index : int
+        x : bool
+
+        Raises
+        ------
+        IndexError
+            if index is not in range [0, 8)
+        """
+        if not 0 <= index < 8:
+            raise IndexError("Index (" + str(index) + ") not in range [0, 8)")
+
+        mask = _OUTPUT_BITS[index]
+        self._raw.value = (self._raw.value & ~mask) | (mask & -bool(x))
+
+    def set_bits(self, mask, values):
+        """Set several pending output triggers at once. See OTriggerStatesView.set_bits.
+
+        Raises
+        ------
+        ValueError
+            if mask is not in range [0, 256)
+        """
+        if not 0 <= mask < 256:
+            raise ValueError("Mask (" + str(mask) + ") not in range [0, 256)")
+
+        self._raw.value = (self._raw.value & ~(mask << 8)) | ((values & mask) << 8)
 
 
 class TriggerStatesView:
+    __slots__ = ("device", "_input", "_output")
+
     def __init__(self, device):
         """Provides a view into device's triggers.
 
@@ -124,22 +294,49 @@ class TriggerStatesView:
         - `triggers['input', 5]` - for a more verbose version of the previous command
         - `triggers.input[5]` - using properties `input` and `output` to access or store triggers separately.
 
+        Several output triggers can be set with one driver call using `with triggers.output_batch() as output: ...`,
+        see OTriggerStatesBatch.
+
         Parameters
         ----------
         device : nvx.device.Device
             NVX device. See nvx.device
         """
         self.device = device
+        self._input = None  # Read on first access to the input property
+        self._output = OTriggerStatesView(device)
+        _trigger_jit.prepare(device.device_handle)  # Compile poll_many's loop now, not on its first call
 
     @property
     def input(self):
-        """Input triggers of the device. Cannot be modified."""
-        return ITriggerStatesView(self.device)
+        """Input triggers of the device. Cannot be modified.
+        Input triggers are a snapshot: they are read from the device on first access and cached. Call refresh() to read
+        them again.
+        """
+        if self._input is None:
+            self._input = ITriggerStatesView(self.device)
+        return self._input
 
     @property
     def output(self):
-        """Output triggers of the device. Can be modified."""
-        return OTriggerStatesView(self.device)
+        """Output triggers of the device. Can be modified.
+        Output triggers are always read from the device, so the same view is returned on every access.
+        """
+        return self._output
+
+    def output_batch(self):
+        """Start a batch of writes to output triggers, sent to the device with one driver call.
+
+        Returns
+        -------
+        OTriggerStatesBatch
+            A new batch, to be used as a context manager. See OTriggerStatesBatch.
+        """
+        return self._output.batch()
+
+    def refresh(self):
+        """Discard the cached input triggers, so that the next access to the input property reads them again."""
+        self._input = None
 
     def __len__(self):
         return 16
@@ -155,15 +352,59 @@ class TriggerStatesView:
         """Returns an iterator to the input+output trigger keys."""
         return self.__iter__()
 
+    def _read(self):
+        """Read all triggers from the device at once.
+
+        Returns
+        -------
+        int
+            Trigger bitfield: input triggers in bits [0, 8), output triggers in bits [8, 16).
+        """
+        triggers = ctypes.c_uint(0)
+        handle_error(raw.NVXGetTriggers(self.device.device_handle, ctypes.byref(triggers)))
+        return triggers.value
+
+    def snapshot(self):
+        """Read all triggers from the device at once.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of 16 uint8 values (0 or 1): input triggers followed by output triggers, in the same order as the
+            keys.
+        """
+        value = self._read()
+        return np.unpackbits(np.array([value & 0xFF, (value >> 8) & 0xFF], dtype=np.uint8), bitorder="little")
+
+    def poll_many(self, n):
+        """Read all triggers from the device n times in a row, as fast as possible.
+        If numba is installed, the reads are done in compiled code, without returning to the interpreter between them.
+
+        Parameters
+        ----------
+        n : int
+            Amount of reads.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of n uint16 trigger bitfields: input triggers in bits [0, 8), output triggers in bits [8, 16).
+        """
+        result = np.empty(n, dtype=np.uint16)
+        handle_error(_trigger_jit.poll(self.device.device_handle, result))
+        return result
+
     def values(self):
-        """Returns an iterator to the input+output trigger states."""
-        for key in self.keys():
-            yield self[key]
+        """Returns an iterator to the input+output trigger states.
+        All states are read from the device at once.
+        """
+        return iter(self.snapshot().astype(bool).tolist())
 
     def items(self):
-        """Returns an iterator to the input+output trigger (keys, values)."""
-        for key in self:
-            yield (key, self[key])
+        """Returns an iterator to the input+output trigger (keys, values).
+        All states are read from the device at once.
+        """
+        return zip(self.keys(), self.values())
 
     def __contains__(self, key):
         """Checks if a trigger with a particular name exists.
@@ -180,10 +421,9 @@ class TriggerStatesView:
             True, if this trigger exists, False otherwise.
         """
         try:
-            self._unpack_key(key)
-        except (KeyError, IndexError, TypeError):
+            return key in _KEYS
+        except TypeError:  # Unhashable key
             return False
-        return True
 
     def _unpack_key(self, key):
         """Converts index, passed to __getitem__ or __setitem__, to a more workable format. Handles any errors.
@@ -203,6 +443,12 @@ class TriggerStatesView:
         IndexError
             If the key-part was recognised, but the index-part was not recognised or incorrect.
         """
+        try:
+            return _KEYS[key]
+        except (KeyError, TypeError):
+            pass
+
+        # Key is invalid: find out why, to raise a descriptive error
         is_output = False
         index = 0
 
@@ -211,13 +457,8 @@ class TriggerStatesView:
                 raise KeyError("Expected a correctly formatted key, got " + key +
                                " (see the docs on TriggerStatesView.__getitem__ for proper indexing)")
 
-            index = int(key[1])
-
-            if index >= 8:
-                raise IndexError("Expected a trigger index 0-7, got " + key[1])
-
-            if key[0] == 'o':
-                is_output = True
+            # Every well-formed key with an index in range is in _KEYS, so only the index can be wrong here
+            raise IndexError("Expected a trigger index 0-7, got " + key[1])
         elif isinstance(key, tuple):
             if len(key) != 2:
                 raise KeyError("Expected a correctly formatted key, got (" + repr(key) +
@@ -262,7 +503,8 @@ class TriggerStatesView:
         if is_output:
             return self.output[index]
         else:
-            return self.input[index]
+            # Always read fresh input triggers, bypassing the cached snapshot
+            return ITriggerStatesView(self.device)[index]
 
     def __setitem__(self, key, value):
         """Set a trigger state.
@@ -286,4 +528,5 @@ class TriggerStatesView:
             raise KeyError("Cannot set input triggers")
 
     def __str__(self):
-        return str(dict(self))
+        value = self._read()
+        return _STR_TEMPLATE.format(*[bool((value >> i) & 1) for i in range(16)])
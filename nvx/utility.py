@@ -2,16 +2,21 @@
 import sys
 
 
+# Error codes defined in the driver, mapped to their messages
+_ERRORS = {
+    -1: "invalid handle (such handle not present now)",
+    -2: "invalid function parameter(s)",
+    -3: "function fail (internal error)",
+    -4: "data rate error",
+}
+
+
 def handle_error(error_code):
     """Convert error code as defined in the driver to user-friendly python exceptions."""
-    if error_code == -1:
-        raise RuntimeError("invalid handle (such handle not present now)")
-    if error_code == -2:
-        raise RuntimeError("invalid function parameter(s)")
-    if error_code == -3:
-        raise RuntimeError("function fail (internal error)")
-    if error_code == -4:
-        raise RuntimeError("data rate error")
+    if error_code >= 0:  # Success, or a count of bytes for some functions
+        return
+    if error_code in _ERRORS:
+        raise RuntimeError(_ERRORS[error_code])
 
 
 def is_64bit():
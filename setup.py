@@ -5,7 +5,8 @@ install_requires = [
 ]
 
 extras_require = {
-      "docs": ["pdoc3"]
+      "docs": ["pdoc3"],
+      "jit": ["numba"]
 }
 
 setup(name="pynvx",